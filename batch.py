@@ -0,0 +1,360 @@
+import argparse
+import asyncio
+import csv
+import json
+import sys
+from datetime import date
+from typing import AsyncIterator, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from config import BATCH_CONCURRENCY, BATCH_FLIGHT_LIMIT, BATCH_REQUESTS_PER_SECOND
+from flight_api import describe_fetch_error, fetch_flights
+from models import RouteQuery
+from utils import filter_flights_by_date
+
+CSV_FIELDS = [
+    "departure",
+    "arrival",
+    "flight_date",
+    "status",
+    "error",
+    "note",
+    "flight_number",
+    "airline",
+    "scheduled_departure",
+    "scheduled_arrival",
+    "departure_terminal",
+    "arrival_terminal",
+    "departure_delay",
+    "flight_status",
+]
+
+
+class RateLimiter:
+    """Spaces out calls so that at most `rate` of them start per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot = max(now, self._next_slot) + self._interval
+
+
+class _LookupAbandoned(Exception):
+    """Set on a shared lookup whose owning task was cancelled before finishing."""
+
+
+class BatchFlightSearch:
+    """
+    Runs flight lookups for many routes with bounded concurrency, a shared
+    rate limit and an in-memory cache. Never calls the LLM.
+
+    Args:
+        concurrency: Maximum number of lookups in flight at once.
+        requests_per_second: Maximum API requests started per second (0 disables).
+        render: Also include the markdown produced by `formatters` in each result.
+        verbose: Log every lookup and failure to stderr.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = BATCH_CONCURRENCY,
+        requests_per_second: float = BATCH_REQUESTS_PER_SECOND,
+        render: bool = False,
+        verbose: bool = False,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.render = render
+        self.verbose = verbose
+        self._rate_limiter = RateLimiter(requests_per_second)
+        self._cache: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(f"DEBUG: {message}", file=sys.stderr)
+
+    async def _lookup(
+        self, query: RouteQuery, semaphore: asyncio.Semaphore
+    ) -> List[Dict]:
+        """Fetch flights for a route, sharing results between identical routes."""
+        key = (query.departure, query.arrival)
+        while key in self._cache:
+            # Duplicates wait outside the semaphore so they don't hold a slot
+            try:
+                return await asyncio.shield(self._cache[key])
+            except _LookupAbandoned:
+                # The owner was cancelled, e.g. its search was closed early;
+                # retry, taking over the lookup if nobody else has yet
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._cache[key] = future
+        try:
+            async with semaphore:
+                await self._rate_limiter.wait()
+                self._log(f"Searching flights from {query.departure} to {query.arrival}")
+                flights = await asyncio.to_thread(
+                    fetch_flights, query.departure, query.arrival, BATCH_FLIGHT_LIMIT
+                )
+        except asyncio.CancelledError:
+            del self._cache[key]
+            future.set_exception(_LookupAbandoned())
+            future.exception()  # Mark as retrieved when nobody else is waiting
+            raise
+        except Exception as e:
+            # Failed lookups are dropped from the cache so later searches
+            # on this searcher retry them instead of reusing the error
+            del self._cache[key]
+            future.set_exception(e)
+            future.exception()
+            raise
+        future.set_result(flights)
+        return flights
+
+    async def search_route(
+        self, query: RouteQuery, semaphore: asyncio.Semaphore
+    ) -> Dict:
+        """Look up a single route and return a result record (errors included)."""
+        result = {
+            "departure": query.departure,
+            "arrival": query.arrival,
+            "flight_date": query.flight_date.isoformat() if query.flight_date else None,
+            "status": "ok",
+            "error": None,
+            "note": None,
+            "flights": [],
+        }
+
+        try:
+            flights = await self._lookup(query, semaphore)
+            if query.flight_date:
+                result["flights"] = filter_flights_by_date(flights, query.flight_date)
+                if flights and not result["flights"]:
+                    # Only the API's latest records are searched, so this is
+                    # not proof that the route has no flights on that date
+                    result["note"] = (
+                        f"no flights on {result['flight_date']} among {len(flights)} returned"
+                    )
+            else:
+                result["flights"] = flights
+            if self.render:
+                from formatters import format_route_flights
+
+                result["rendered"] = format_route_flights(
+                    flights, query.departure, query.arrival, query.flight_date
+                )
+        except Exception as e:
+            self._log(f"Search from {query.departure} to {query.arrival} failed: {e!r}")
+            result["status"] = "error"
+            result["error"] = describe_fetch_error(e, query.departure, query.arrival)
+            result["note"] = None
+            result["flights"] = []
+            result.pop("rendered", None)
+
+        return result
+
+    async def search(self, queries: Iterable[RouteQuery]) -> AsyncIterator[Dict]:
+        """Yield a result record for every query, in completion order."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            asyncio.create_task(self.search_route(query, semaphore))
+            for query in queries
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def search_routes(
+    routes: Iterable[Tuple[str, str, Optional[date]]],
+    concurrency: int = BATCH_CONCURRENCY,
+    requests_per_second: float = BATCH_REQUESTS_PER_SECOND,
+    render: bool = False,
+    verbose: bool = False,
+) -> AsyncIterator[Dict]:
+    """
+    Searches flights for many (departure, arrival, date) routes.
+
+    Each route is fetched once, returning the API's latest `BATCH_FLIGHT_LIMIT`
+    records. A date only filters those records on the client; when it drops
+    every one of them the result carries a `note` saying so.
+
+    Args:
+        routes: Tuples of departure code, arrival code and an optional date.
+            Without a date, every flight the API returns for the route is kept.
+        concurrency: Maximum number of lookups in flight at once.
+        requests_per_second: Maximum API requests started per second.
+        render: Include the formatted markdown for each route.
+        verbose: Log every lookup and failure to stderr.
+
+    Yields:
+        One result dict per route, as soon as its lookup completes.
+    """
+    searcher = BatchFlightSearch(concurrency, requests_per_second, render, verbose)
+    queries = [
+        RouteQuery(
+            departure=dep.strip().upper(),
+            arrival=arr.strip().upper(),
+            flight_date=flight_date,
+        )
+        for dep, arr, flight_date in routes
+    ]
+    async for result in searcher.search(queries):
+        yield result
+
+
+def result_to_csv_rows(result: Dict) -> List[Dict]:
+    """Flatten a result record into one CSV row per flight."""
+    base = {
+        "departure": result["departure"],
+        "arrival": result["arrival"],
+        "flight_date": result["flight_date"],
+        "status": result["status"],
+        "error": result["error"] or "",
+        "note": result["note"] or "",
+    }
+    if not result["flights"]:
+        return [base]
+
+    rows = []
+    for flight in result["flights"]:
+        departure = flight.get("departure") or {}
+        arrival = flight.get("arrival") or {}
+        rows.append(
+            {
+                **base,
+                "flight_number": (flight.get("flight") or {}).get("iata"),
+                "airline": (flight.get("airline") or {}).get("name"),
+                "scheduled_departure": departure.get("scheduled"),
+                "scheduled_arrival": arrival.get("scheduled"),
+                "departure_terminal": departure.get("terminal"),
+                "arrival_terminal": arrival.get("terminal"),
+                "departure_delay": departure.get("delay"),
+                "flight_status": flight.get("flight_status"),
+            }
+        )
+    return rows
+
+
+def read_routes(source: TextIO) -> List[Tuple[str, str, Optional[date]]]:
+    """Read `departure,arrival[,date]` lines, skipping blanks, comments and a header."""
+    routes = []
+    reader = csv.reader(source)
+    for row in reader:
+        if not row or not row[0].strip() or row[0].strip().startswith("#"):
+            continue
+        if row[0].strip().lower() == "departure":
+            continue
+        if len(row) < 2 or not row[1].strip():
+            raise ValueError(
+                f"line {reader.line_num}: expected departure,arrival[,date], got '{','.join(row)}'"
+            )
+        flight_date = None
+        if len(row) > 2 and row[2].strip():
+            try:
+                flight_date = date.fromisoformat(row[2].strip())
+            except ValueError:
+                raise ValueError(
+                    f"line {reader.line_num}: invalid date '{row[2].strip()}', expected YYYY-MM-DD"
+                )
+        routes.append((row[0], row[1], flight_date))
+    return routes
+
+
+async def run_batch(
+    routes: List[Tuple[str, str, Optional[date]]], args: argparse.Namespace
+) -> int:
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    failures = 0
+    try:
+        writer = None
+        if args.format == "csv":
+            writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+
+        async for result in search_routes(
+            routes, args.concurrency, args.rate, args.render, args.verbose
+        ):
+            if result["status"] != "ok":
+                failures += 1
+            if writer:
+                writer.writerows(result_to_csv_rows(result))
+            else:
+                out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Searched {len(routes)} routes, {failures} failed.", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Search flights for many routes without going through the chat assistant."
+    )
+    parser.add_argument(
+        "input",
+        help="CSV file of departure,arrival[,YYYY-MM-DD] lines, or '-' for stdin",
+    )
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=BATCH_CONCURRENCY,
+        help="Maximum lookups in flight at once",
+    )
+    parser.add_argument(
+        "-r",
+        "--rate",
+        type=float,
+        default=BATCH_REQUESTS_PER_SECOND,
+        help="Maximum API requests per second (0 to disable)",
+    )
+    parser.add_argument(
+        "--render",
+        action="store_true",
+        help="Include the formatted markdown in JSONL output",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Log every lookup and failure to stderr",
+    )
+    args = parser.parse_args(argv)
+
+    if args.render and args.format == "csv":
+        parser.error("--render is only supported with --format jsonl")
+
+    try:
+        if args.input == "-":
+            routes = read_routes(sys.stdin)
+        else:
+            with open(args.input, newline="") as f:
+                routes = read_routes(f)
+    except OSError as e:
+        parser.error(f"cannot read {args.input}: {e.strerror}")
+    except ValueError as e:
+        parser.error(f"{args.input}: {e}")
+
+    return asyncio.run(run_batch(routes, args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
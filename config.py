@@ -7,8 +7,6 @@ load_dotenv()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 AVIATIONSTACK_KEY = os.getenv("AVIATIONSTACK_KEY")
 
-if not GEMINI_API_KEY:
-    raise ValueError("GEMINI_API_KEY is not set. Please set it in the .env file.")
 if not AVIATIONSTACK_KEY:
     raise ValueError("AVIATIONSTACK_KEY is not set. Please set it in the .env file.")
 
@@ -88,3 +86,8 @@ MULTIPLE_AIRPORTS = {
 
 API_TIMEOUT = 15
 MAX_FLIGHT_RESULTS = 10
+
+# Batch search defaults
+BATCH_CONCURRENCY = 5
+BATCH_REQUESTS_PER_SECOND = 2.0
+BATCH_FLIGHT_LIMIT = 100  # AviationStack's maximum records per request
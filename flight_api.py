@@ -0,0 +1,73 @@
+import requests
+from typing import Dict, List
+from config import AVIATIONSTACK_KEY, API_TIMEOUT, MAX_FLIGHT_RESULTS
+
+API_URL = "http://api.aviationstack.com/v1/flights"
+
+
+class FlightAPIError(Exception):
+    """Raised when the API reports an error inside a 200 OK response."""
+
+    def __init__(self, info: str, code=None):
+        super().__init__(info)
+        self.info = info
+        self.code = code
+
+
+def fetch_flights(
+    departure: str, arrival: str, limit: int = MAX_FLIGHT_RESULTS
+) -> List[Dict]:
+    """
+    Fetches raw flight records for a route from the AviationStack API.
+
+    Args:
+        departure: Departure airport IATA code.
+        arrival: Arrival airport IATA code.
+        limit: Maximum number of records to request.
+
+    Returns:
+        The list of flight dicts from the API response (may be empty).
+
+    Raises:
+        FlightAPIError: If the API returns an error payload.
+        requests.exceptions.RequestException: On HTTP or network failures.
+    """
+    api_params = {
+        "access_key": AVIATIONSTACK_KEY,
+        "dep_iata": departure,
+        "arr_iata": arrival,
+        "limit": limit,
+    }
+
+    response = requests.get(API_URL, params=api_params, timeout=API_TIMEOUT)
+    response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
+
+    data = response.json()
+
+    # Check for API-level errors returned in a 200 OK response
+    if "error" in data:
+        error_info = data["error"]
+        raise FlightAPIError(
+            error_info.get("info", "No additional information provided."),
+            error_info.get("code"),
+        )
+
+    return data.get("data", [])
+
+
+def describe_fetch_error(error: Exception, departure: str, arrival: str) -> str:
+    """Turn an exception raised while fetching flights into a user-facing message."""
+    if isinstance(error, FlightAPIError):
+        return f"An error occurred while fetching flight data: {error.info} (Code: {error.code})"
+    if isinstance(error, requests.exceptions.HTTPError):
+        status_code = error.response.status_code
+        if status_code == 422:
+            return f"Error: Invalid airport code provided. Please double-check the departure '{departure}' and arrival '{arrival}' codes and try again."
+        elif status_code == 401:
+            return "API Key Error: Authentication failed. Please check the AVIATIONSTACK_KEY."
+        return f"Error Fetching Flight Data: The server returned status {status_code}. Please try again later."
+    if isinstance(error, requests.exceptions.Timeout):
+        return "Request Timed Out: The flight search is taking too long. Please try again in a moment."
+    if isinstance(error, requests.exceptions.RequestException):
+        return "Network Error: Could not connect to the flight data service. Please check your internet connection."
+    return f"An unexpected error occurred: {error}. Please try again."
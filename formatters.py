@@ -1,7 +1,8 @@
 import textwrap
 from datetime import date, datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from utils import (
+    filter_flights_by_date,
     format_flight_time,
     format_date,
     generate_booking_url,
@@ -128,7 +129,7 @@ def _format_single_upcoming_flight_card(
 
 
 def format_flight_info(flights_data: List[Dict], flight_date: date) -> str:
-    """Format today's flight information in a structured way."""
+    """Format the flights for a single date in a structured way."""
     if not flights_data:
         return "No flights found for today."
 
@@ -138,10 +139,11 @@ def format_flight_info(flights_data: List[Dict], flight_date: date) -> str:
     arr_city = first_flight["arrival"]["airport"]
     arr_code = first_flight["arrival"]["iata"]
     formatted_date = format_date(flight_date)
+    heading = "TODAY'S FLIGHTS" if flight_date == date.today() else "FLIGHTS"
 
     header = [
         "# FLIGHT SEARCH RESULTS",
-        f"## TODAY'S FLIGHTS - {formatted_date}",
+        f"## {heading} - {formatted_date}",
         f"### {dep_city} ({dep_code}) to {arr_city} ({arr_code})",
         "---",
     ]
@@ -211,9 +213,14 @@ def format_upcoming_flights_info(
     return "\n".join(response_parts)
 
 
-def format_no_flights_message(dep_code: str, arr_code: str) -> str:
+def format_no_flights_message(
+    dep_code: str, arr_code: str, flight_date: Optional[date] = None
+) -> str:
     """Format message when no flights are found at all"""
-    today_formatted = format_date(date.today())
+    if flight_date:
+        search_period = format_date(flight_date)
+    else:
+        search_period = f"{format_date(date.today())} - Next 7 days"
 
     message = f"""
     # FLIGHT SEARCH RESULTS
@@ -221,7 +228,7 @@ def format_no_flights_message(dep_code: str, arr_code: str) -> str:
     ## NO FLIGHTS FOUND
     ### {dep_code} to {arr_code}
 
-    **Search Period:** {today_formatted} - Next 7 days
+    **Search Period:** {search_period}
 
     ---
 
@@ -237,3 +244,32 @@ def format_no_flights_message(dep_code: str, arr_code: str) -> str:
     **Need help?** Just ask me to search for flights from different cities or airports!
     """
     return textwrap.dedent(message).strip()
+
+
+def format_route_flights(
+    flights_data: List[Dict],
+    dep_code: str,
+    arr_code: str,
+    flight_date: Optional[date] = None,
+) -> str:
+    """
+    Format the flights returned for a route.
+
+    Without a date, today's flights are shown, falling back to the upcoming
+    flights when there are none today. With a date, only that date is shown.
+    """
+    if flight_date:
+        dated_flights = filter_flights_by_date(flights_data, flight_date)
+        if not dated_flights:
+            return format_no_flights_message(dep_code, arr_code, flight_date)
+        return format_flight_info(dated_flights, flight_date)
+
+    if not flights_data:
+        return format_no_flights_message(dep_code, arr_code)
+
+    today = date.today()
+    todays_flights = filter_flights_by_date(flights_data, today)
+    if todays_flights:
+        return format_flight_info(todays_flights, today)
+    # If no flights for today, treat all results as "upcoming"
+    return format_upcoming_flights_info(flights_data, dep_code, arr_code)
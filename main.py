@@ -11,6 +11,9 @@ from config import GEMINI_API_KEY
 from tools import get_flights, get_city_airport_code
 from agent_config import AGENT_INSTRUCTIONS
 
+if not GEMINI_API_KEY:
+    raise ValueError("GEMINI_API_KEY is not set. Please set it in the .env file.")
+
 @cl.on_chat_start
 async def start():
     """Initialize the chat session with agent configuration"""
@@ -1,3 +1,5 @@
+from datetime import date
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -8,3 +10,11 @@ class GetCityAirportParams(BaseModel):
 class GetFlightsParams(BaseModel):
     departure: str = Field(..., description="Departure airport code")
     arrival: str = Field(..., description="Arrival airport code")
+
+
+class RouteQuery(BaseModel):
+    departure: str = Field(..., description="Departure airport code")
+    arrival: str = Field(..., description="Arrival airport code")
+    flight_date: Optional[date] = Field(
+        None, description="Date to filter flights by (None means today or upcoming)"
+    )
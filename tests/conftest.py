@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modules live at the repository root and read API keys at import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("AVIATIONSTACK_KEY", "test-key")
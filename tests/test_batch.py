@@ -0,0 +1,333 @@
+import asyncio
+import io
+import json
+import time
+from datetime import date
+
+import pytest
+
+import batch
+import flight_api
+
+
+def make_flight(dep_code, arr_code, flight_date, **overrides):
+    flight = {
+        "flight_date": flight_date,
+        "flight_status": "scheduled",
+        "flight": {"iata": "EK601"},
+        "airline": {"name": "Emirates", "iata": "EK"},
+        "departure": {
+            "airport": "Jinnah International",
+            "iata": dep_code,
+            "scheduled": f"{flight_date}T10:00:00+00:00",
+            "terminal": "1",
+            "delay": 15,
+        },
+        "arrival": {
+            "airport": "Dubai",
+            "iata": arr_code,
+            "scheduled": f"{flight_date}T12:00:00+00:00",
+            "terminal": "3",
+        },
+    }
+    flight.update(overrides)
+    return flight
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def collect(routes, **kwargs):
+    async def run():
+        return [result async for result in batch.search_routes(routes, **kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_duplicate_routes_make_one_call(monkeypatch):
+    calls = []
+
+    def fake_fetch(departure, arrival, limit):
+        calls.append((departure, arrival))
+        time.sleep(0.05)
+        return [make_flight(departure, arrival, date.today().isoformat())]
+
+    monkeypatch.setattr(batch, "fetch_flights", fake_fetch)
+
+    results = collect(
+        [("KHI", "DXB", None), ("khi", " dxb ", None), ("KHI", "DXB", None)],
+        concurrency=1,
+        requests_per_second=0,
+    )
+
+    assert calls == [("KHI", "DXB")]
+    assert len(results) == 3
+    assert all(r["status"] == "ok" and len(r["flights"]) == 1 for r in results)
+
+
+def test_error_on_one_route_does_not_abort_others(monkeypatch):
+    def fake_get(url, params, timeout):
+        if params["dep_iata"] == "BAD":
+            return FakeResponse({"error": {"code": 422, "info": "Invalid airport"}})
+        if params["dep_iata"] == "LST":
+            return FakeResponse([])  # 200 response whose body is a list
+        return FakeResponse(
+            {"data": [make_flight(params["dep_iata"], params["arr_iata"], "2026-10-19")]}
+        )
+
+    monkeypatch.setattr(flight_api.requests, "get", fake_get)
+
+    results = collect(
+        [("BAD", "DXB", None), ("LST", "DXB", None), ("KHI", "DXB", None)],
+        requests_per_second=0,
+    )
+    by_dep = {r["departure"]: r for r in results}
+
+    assert by_dep["BAD"]["status"] == "error"
+    assert by_dep["BAD"]["error"] == (
+        "An error occurred while fetching flight data: Invalid airport (Code: 422)"
+    )
+    assert by_dep["LST"]["status"] == "error"
+    assert by_dep["KHI"]["status"] == "ok"
+
+
+def test_render_failure_is_reported_per_route(monkeypatch):
+    today = date.today().isoformat()
+    broken = make_flight("KHI", "DXB", today)
+    del broken["departure"]["airport"]
+
+    def fake_fetch(departure, arrival, limit):
+        if departure == "KHI":
+            return [broken]
+        return [make_flight(departure, arrival, today)]
+
+    monkeypatch.setattr(batch, "fetch_flights", fake_fetch)
+
+    results = collect(
+        [("KHI", "DXB", None), ("LHE", "DXB", None)],
+        requests_per_second=0,
+        render=True,
+    )
+    by_dep = {r["departure"]: r for r in results}
+
+    assert by_dep["KHI"]["status"] == "error"
+    assert "rendered" not in by_dep["KHI"]
+    assert by_dep["LHE"]["status"] == "ok"
+    assert "FLIGHT SEARCH RESULTS" in by_dep["LHE"]["rendered"]
+
+
+def test_explicit_date_filters_flights_client_side(monkeypatch):
+    def fake_fetch(departure, arrival, limit):
+        return [
+            make_flight(departure, arrival, "2026-10-19"),
+            make_flight(departure, arrival, "2026-10-20"),
+        ]
+
+    monkeypatch.setattr(batch, "fetch_flights", fake_fetch)
+
+    dated, undated = sorted(
+        collect(
+            [("KHI", "DXB", date(2026, 10, 20)), ("LHE", "DXB", None)],
+            requests_per_second=0,
+        ),
+        key=lambda r: r["departure"],
+    )
+
+    assert dated["flight_date"] == "2026-10-20"
+    assert [f["flight_date"] for f in dated["flights"]] == ["2026-10-20"]
+    assert dated["note"] is None
+    assert undated["flight_date"] is None
+    assert len(undated["flights"]) == 2
+
+
+def test_date_outside_returned_flights_is_noted_and_rendered_consistently(
+    monkeypatch,
+):
+    def fake_fetch(departure, arrival, limit):
+        return [make_flight(departure, arrival, "2026-10-19")]
+
+    monkeypatch.setattr(batch, "fetch_flights", fake_fetch)
+
+    (result,) = collect(
+        [("KHI", "DXB", date(2026, 10, 25))], requests_per_second=0, render=True
+    )
+
+    assert result["status"] == "ok"
+    assert result["flights"] == []
+    assert result["note"] == "no flights on 2026-10-25 among 1 returned"
+    assert "NO FLIGHTS FOUND" in result["rendered"]
+    assert "Sunday, October 25, 2026" in result["rendered"]
+    assert "October 19" not in result["rendered"]
+    assert "TODAY" not in result["rendered"]
+
+
+def test_dated_render_lists_only_that_date(monkeypatch):
+    def fake_fetch(departure, arrival, limit):
+        return [
+            make_flight(departure, arrival, "2026-10-19"),
+            make_flight(departure, arrival, "2026-10-25", flight={"iata": "EK603"}),
+        ]
+
+    monkeypatch.setattr(batch, "fetch_flights", fake_fetch)
+
+    (result,) = collect(
+        [("KHI", "DXB", date(2026, 10, 25))], requests_per_second=0, render=True
+    )
+
+    assert "FLIGHTS - Sunday, October 25, 2026" in result["rendered"]
+    assert "EK603" in result["rendered"]
+    assert "EK601" not in result["rendered"]
+
+
+def test_closing_one_search_does_not_cancel_another_on_shared_searcher(
+    monkeypatch,
+):
+    calls = []
+
+    def fake_fetch(departure, arrival, limit):
+        calls.append((departure, arrival))
+        time.sleep(0.05)
+        return [make_flight(departure, arrival, "2026-10-19")]
+
+    monkeypatch.setattr(batch, "fetch_flights", fake_fetch)
+    queries = [
+        batch.RouteQuery(departure=dep, arrival="DXB")
+        for dep in ("KHI", "LHE", "ISB", "PEW")
+    ]
+
+    async def run():
+        searcher = batch.BatchFlightSearch(concurrency=1, requests_per_second=0)
+
+        async def close_after_first():
+            results = searcher.search(queries)
+            async for _ in results:
+                break
+            await results.aclose()
+
+        async def consume_all():
+            return [result async for result in searcher.search(queries)]
+
+        _, results = await asyncio.gather(close_after_first(), consume_all())
+        return results
+
+    results = asyncio.run(run())
+
+    assert sorted(r["departure"] for r in results) == ["ISB", "KHI", "LHE", "PEW"]
+    assert all(r["status"] == "ok" for r in results)
+
+
+def test_stdout_holds_only_jsonl(monkeypatch, tmp_path, capsys):
+    def fake_get(url, params, timeout):
+        if params["dep_iata"] == "BAD":
+            return FakeResponse({"error": {"code": 422, "info": "Invalid"}})
+        return FakeResponse(
+            {"data": [make_flight(params["dep_iata"], params["arr_iata"], "2026-10-19")]}
+        )
+
+    monkeypatch.setattr(flight_api.requests, "get", fake_get)
+    routes_file = tmp_path / "routes.csv"
+    routes_file.write_text("departure,arrival,date\nKHI,DXB\nBAD,DXB\n")
+
+    exit_code = batch.main([str(routes_file), "-r", "0"])
+
+    out = capsys.readouterr().out
+    records = [json.loads(line) for line in out.splitlines()]
+    assert exit_code == 1
+    assert sorted(r["status"] for r in records) == ["error", "ok"]
+
+
+def test_csv_rows_flatten_one_row_per_flight():
+    result = {
+        "departure": "KHI",
+        "arrival": "DXB",
+        "flight_date": None,
+        "status": "ok",
+        "error": None,
+        "note": None,
+        "flights": [
+            make_flight("KHI", "DXB", "2026-10-19"),
+            make_flight("KHI", "DXB", "2026-10-19", flight={"iata": "EK603"}),
+        ],
+    }
+
+    rows = batch.result_to_csv_rows(result)
+
+    assert [row["flight_number"] for row in rows] == ["EK601", "EK603"]
+    assert rows[0]["airline"] == "Emirates"
+    assert rows[0]["departure_delay"] == 15
+    assert rows[0]["error"] == ""
+    assert set(rows[0]) <= set(batch.CSV_FIELDS)
+
+
+def test_csv_rows_for_failed_route():
+    result = {
+        "departure": "BAD",
+        "arrival": "DXB",
+        "flight_date": "2026-10-19",
+        "status": "error",
+        "error": "HTTP Error 422",
+        "note": None,
+        "flights": [],
+    }
+
+    assert batch.result_to_csv_rows(result) == [
+        {
+            "departure": "BAD",
+            "arrival": "DXB",
+            "flight_date": "2026-10-19",
+            "status": "error",
+            "error": "HTTP Error 422",
+            "note": "",
+        }
+    ]
+
+
+def test_read_routes_skips_header_comments_and_blanks():
+    source = io.StringIO("departure,arrival,date\n# nightly\n\nKHI,DXB\nLHE,ISB,2026-10-20\n")
+
+    assert batch.read_routes(source) == [
+        ("KHI", "DXB", None),
+        ("LHE", "ISB", date(2026, 10, 20)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        ("KHI,DXB\nLHE\n", "line 2: expected departure,arrival"),
+        ("KHI,DXB,2026-13-01\n", "line 1: invalid date '2026-13-01'"),
+    ],
+)
+def test_read_routes_rejects_bad_input(content, message):
+    with pytest.raises(ValueError, match=message):
+        batch.read_routes(io.StringIO(content))
+
+
+def test_main_reports_bad_input_without_traceback(tmp_path, capsys):
+    routes_file = tmp_path / "routes.csv"
+    routes_file.write_text("KHI,DXB,tomorrow\n")
+
+    with pytest.raises(SystemExit) as excinfo:
+        batch.main([str(routes_file)])
+
+    assert excinfo.value.code == 2
+    assert "line 1: invalid date 'tomorrow'" in capsys.readouterr().err
+
+
+def test_main_rejects_render_with_csv(tmp_path, capsys):
+    routes_file = tmp_path / "routes.csv"
+    routes_file.write_text("KHI,DXB\n")
+
+    with pytest.raises(SystemExit) as excinfo:
+        batch.main([str(routes_file), "-f", "csv", "--render"])
+
+    assert excinfo.value.code == 2
+    assert "--render is only supported with --format jsonl" in capsys.readouterr().err
@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from typing import Dict
+from typing import Dict, List
 
 
 def format_flight_time(time_str: str) -> str:
@@ -21,6 +21,12 @@ def format_date(date_obj) -> str:
         return str(date_obj)
 
 
+def filter_flights_by_date(flights: List[Dict], flight_date: date) -> List[Dict]:
+    """Keep only the flights scheduled on the given date"""
+    date_str = flight_date.isoformat()
+    return [f for f in flights if f.get("flight_date") == date_str]
+
+
 def generate_booking_url(flight: Dict, dep_code: str, arr_code: str) -> str:
     """Generate booking URL based on airline or use travel aggregator"""
     try: